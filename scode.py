@@ -1,5 +1,13 @@
+import numpy as np
 import pandas as pd
+import csv
+import io
+import logging
+import mmap
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
 from pathlib import Path
 
 # ============================================
@@ -22,10 +30,64 @@ EXCEL_SHEET_NAME = 'Update_Values'
 # Output file suffix
 OUTPUT_SUFFIX = ''
 
+# Number of files processed in parallel (None uses all CPU cores)
+MAX_WORKERS = None
+
+# Logging level - use logging.DEBUG to also show the data before and after updates
+LOG_LEVEL = logging.INFO
+
+# Line markers in RPT files
+FOOTER_LINE = re.compile(rb'^[ \t]*##', re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
 # ============================================
 # FUNCTIONS
 # ============================================
 
+def init_logging():
+    """Configure logging, also called in each worker process"""
+    logging.basicConfig(level=LOG_LEVEL, format='%(message)s')
+
+
+def decode_lines(raw):
+    """Decode raw file bytes to text with newlines normalized to LF"""
+    return raw.decode('utf-8').replace('\r\n', '\n')
+
+
+def select_data_lines(block, n_fields):
+    """
+    Keep the lines of block that are data rows with exactly n_fields values
+    
+    A data row starts with * and, split on commas, has n_fields values after
+    the marker. Other lines (comments, blank lines, malformed rows) are removed
+    so read_csv never pads short rows. Lines and commas are found with NumPy
+    rather than a Python loop over the lines.
+    """
+    raw = np.frombuffer(block, dtype=np.uint8)
+    if len(raw) == 0:
+        return block
+    
+    # Start and end (exclusive, including the newline) of every line
+    line_ends = np.flatnonzero(raw == ord('\n')) + 1
+    starts = np.concatenate(([0], line_ends))
+    stops = np.concatenate((line_ends, [len(raw)]))
+    if starts[-1] == len(raw):
+        starts, stops = starts[:-1], stops[:-1]
+    
+    # Data rows start with *, lines indented with whitespace are checked one by one
+    first = raw[starts]
+    is_data = first == ord('*')
+    for i in np.flatnonzero(np.isin(first, list(b' \t\r\x0b\x0c'))):
+        is_data[i] = block[starts[i]:stops[i]].lstrip()[:1] == b'*'
+    
+    n_commas = np.add.reduceat(raw == ord(','), starts, dtype=np.int64)
+    keep = is_data & (n_commas == n_fields)
+    if keep.all():
+        return block
+    return raw[np.repeat(keep, stops - starts)].tobytes()
+
+
 def read_rpt_file(file_path):
     """
     Read a single .rpt file, skipping header (line 1) and footer (lines after ##)
@@ -36,82 +98,95 @@ def read_rpt_file(file_path):
     Returns:
         pandas DataFrame with the data, header line, footer lines, and columns with quotes
     """
-    all_data = []
-    columns = None
     header_line = None
     footer_lines = []
     columns_with_quotes = set()  # Track which columns had quoted values
     column_marker = None
     
-    print(f"Processing: {file_path.name}")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Save header
-    if len(lines) > 0:
-        header_line = lines[0]
-    
-    # Skip first line (header)
-    if len(lines) <= 1:
-        return pd.DataFrame(), header_line, footer_lines, columns_with_quotes
-    
-    # Find where footer starts (line with ## at the beginning)
-    footer_start = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith('##'):
-            footer_start = i
-            break
+    logger.info("Processing: %s", file_path.name)
     
-    # Save footer
-    if footer_start is not None:
-        footer_lines = lines[footer_start:]
+    # Empty files cannot be memory-mapped
+    if os.path.getsize(file_path) == 0:
+        return pd.DataFrame(), header_line, footer_lines, columns_with_quotes, column_marker
     
-    # Extract data lines (skip line 0, stop before footer)
-    if footer_start is not None:
-        data_lines = lines[1:footer_start]
-    else:
-        data_lines = lines[1:]
-    
-    # Parse each data line
-    first_data_row = True
-    for line in data_lines:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
+    # Map the file instead of reading it, only header and footer get decoded
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Save header
+        header_end = mm.find(b'\n') + 1 or len(mm)
+        header_line = decode_lines(mm[:header_end])
+        
+        # Skip first line (header)
+        if header_end >= len(mm):
+            return pd.DataFrame(), header_line, footer_lines, columns_with_quotes, column_marker
         
-        parts = line.split(',')
+        # Find where footer starts (line with ## at the beginning) and save it
+        footer_match = FOOTER_LINE.search(mm)
+        footer_start = footer_match.start() if footer_match else len(mm)
+        if footer_match:
+            footer_lines = decode_lines(mm[footer_start:]).splitlines(keepends=True)
+        
+        # Walk the lines before the data, dispatching on their first byte, until
+        # the column header and the first data row are found
+        col_line = None
+        first_row = None
+        data_start = pos = header_end
+        while pos < footer_start:
+            line_end = mm.find(b'\n', pos, footer_start)
+            if line_end == -1:
+                line_end = footer_start
+            line = mm[pos:line_end].strip()
+            marker = line[:1]
+            if marker == b'!' and col_line is None:
+                col_line = line
+                data_start = line_end + 1
+            elif marker == b'*' and col_line is not None:
+                first_row = line
+                break
+            pos = line_end + 1
         
         # Parse column header: !1,SPCODE,POL_NO,...
-        if columns is None and parts[0].startswith('!'):
-            col_parts = [p.strip('!').strip() for p in parts]
-            if col_parts:
-                column_marker = col_parts[0]
-                columns = col_parts[1:]
-            continue
+        if col_line is None:
+            return pd.DataFrame(), header_line, footer_lines, columns_with_quotes, column_marker
+        col_parts = [p.strip('!').strip() for p in col_line.decode('utf-8').split(',')]
+        column_marker = col_parts[0]
+        columns = col_parts[1:]
         
-        # Parse data row: *,5,"XY1100",...
-        if parts[0].startswith('*'):
-            # Track quoted columns from first data row only
-            if first_data_row:
-                for i, p in enumerate(parts[1:]):
-                    p = p.strip()
-                    if p.startswith('"') and p.endswith('"') and i < len(columns):
-                        columns_with_quotes.add(columns[i])
-                first_data_row = False
-            
-            # Build row data - just remove quotes, pandas handles the rest
-            row_data = [p.strip('"') for p in parts[1:]]
-            
-            if row_data and columns and len(row_data) == len(columns):
-                all_data.append(row_data)
+        # Track quoted columns from first data row only: *,5,"XY1100",...
+        if first_row is None or not columns:
+            return pd.DataFrame(), header_line, footer_lines, columns_with_quotes, column_marker
+        first_values = first_row.decode('utf-8').split(',')[1:len(columns) + 1]
+        for col_name, p in zip(columns, first_values):
+            if p[:1] == '"' and p[-1:] == '"':
+                columns_with_quotes.add(col_name)
+        
+        # Only data rows with one value per column are kept
+        data_block = select_data_lines(mm[data_start:footer_start], len(columns))
     
-    # Create DataFrame
-    if all_data and columns:
-        df = pd.DataFrame(all_data, columns=columns)
-        return df, header_line, footer_lines, columns_with_quotes, column_marker
-    else:
+    if not data_block:
         return pd.DataFrame(), header_line, footer_lines, columns_with_quotes, column_marker
+    
+    # Parse data rows in pandas' C parser, splitting on every comma like before,
+    # into Arrow-backed string columns. The * marker column is skipped, so
+    # the parsed columns are used as they are
+    df = pd.read_csv(
+        io.BytesIO(data_block),
+        header=None,
+        names=range(len(columns) + 1),
+        usecols=range(1, len(columns) + 1),
+        dtype='string[pyarrow]',
+        encoding='utf-8',
+        quoting=csv.QUOTE_NONE,
+        keep_default_na=False,
+        engine='c',
+    )
+    df.columns = columns
+    
+    # Lines were stripped before splitting, then every value had its quotes removed
+    df.isetitem(len(columns) - 1, df.iloc[:, -1].str.rstrip())
+    for i in range(len(columns)):
+        df.isetitem(i, df.iloc[:, i].str.strip('"'))
+    
+    return df, header_line, footer_lines, columns_with_quotes, column_marker
 
 
 def write_rpt_file(df, output_path, header_line, footer_lines, columns_with_quotes, column_marker=None):
@@ -126,62 +201,121 @@ def write_rpt_file(df, output_path, header_line, footer_lines, columns_with_quot
         columns_with_quotes: Set of column names that should have quoted values
         column_marker: The marker value to use in column header (e.g., '1')
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Update and write header (update column count if needed)
-        if header_line:
-            parts = header_line.strip().split()
-            if len(parts) > 0:
-                # Update first value (column count)
-                parts[0] = str(len(df.columns))
-                f.write(' '.join(parts) + '\n')
-            else:
-                f.write(header_line)
-        
-        # Write column header line
-        if column_marker:
-            col_line = '!' + column_marker + ',' + ','.join(df.columns)
+    # Build the whole file in memory and write it with a single call
+    output = []
+    
+    # Update and write header (update column count if needed)
+    if header_line:
+        parts = header_line.strip().split()
+        if len(parts) > 0:
+            # Update first value (column count)
+            parts[0] = str(len(df.columns))
+            output.append(' '.join(parts) + '\n')
         else:
-            col_line = '!' + ','.join(df.columns)
-        f.write(col_line + '\n')
+            output.append(header_line)
+    
+    # Write column header line
+    if column_marker:
+        col_line = '!' + column_marker + ',' + ','.join(df.columns)
+    else:
+        col_line = '!' + ','.join(df.columns)
+    output.append(col_line + '\n')
+    
+    # Write data rows - format whole columns at once instead of row by row
+    if len(df) > 0 and len(df.columns) > 0:
+        # Quoting is a column property, decide it once per column
+        quoted = [col_name in columns_with_quotes for col_name in df.columns]
         
-        # Write data rows
-        for idx, row in df.iterrows():
-            # Format each value - add quotes based on original file format
-            formatted_values = []
-            for col_name, val in zip(df.columns, row):
-                # Add quotes if this column had quotes originally
-                if col_name in columns_with_quotes:
-                    formatted_values.append(f'"{val}"')
-                else:
-                    formatted_values.append(str(val))
-            
-            data_line = '*,' + ','.join(formatted_values)
-            f.write(data_line + '\n')
+        formatted_cols = []
+        for i, is_quoted in enumerate(quoted):
+            values = to_string_series(df.iloc[:, i])
+            # Add quotes if this column had quotes originally
+            if is_quoted:
+                values = '"' + values + '"'
+            formatted_cols.append(values)
         
-        # Write blank line before footer
-        f.write('\n')
+        # Join a plain list, iterating the Series itself is much slower
+        data_lines = '*,' + reduce(lambda a, b: a + ',' + b, formatted_cols)
+        output.append('\n'.join(data_lines.tolist()) + '\n')
+    
+    # Write blank line before footer
+    output.append('\n')
+    
+    # Write footer
+    if footer_lines:
+        output.extend(footer_lines)
+    
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(''.join(output))
+    
+    logger.info("Written to: %s", output_path)
+
+
+def to_string_series(series):
+    """Return series as strings, reusing it if it already has a string dtype
+    
+    Missing values become the text str() gives them ('nan', '<NA>'), since
+    astype(str) keeps them missing on newer pandas
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        if series.hasnans:
+            return series.fillna(str(series.dtype.na_value))
+        return series
+    return series.map(str)
+
+
+def to_numbers(values):
+    """Convert values to a float array, NaN where a value is not a number"""
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+
+def make_matcher(series, numbers=None):
+    """Build a function that compares series against a value - numeric if
+    possible, otherwise case-sensitive string
+    
+    The numeric conversion and the split into numeric and string values are
+    done once, so repeated lookups in the same column only do the comparisons
+    """
+    if numbers is None:
+        numbers = to_numbers(series)
+    not_numeric = np.isnan(numbers)
+    strings = to_string_series(series)
+    other_strings = strings[not_numeric] if not_numeric.any() else None
+    
+    def match(target_value):
+        try:
+            target_numeric = pd.to_numeric(target_value)
+        except (ValueError, TypeError):
+            return (strings == str(target_value)).to_numpy(dtype=bool, na_value=False)
         
-        # Write footer
-        if footer_lines:
-            for line in footer_lines:
-                f.write(line)
+        mask = numbers == target_numeric
+        # Values that are not numbers fall back to the string comparison
+        if other_strings is not None:
+            mask[not_numeric] = (other_strings == str(target_value)).to_numpy(dtype=bool, na_value=False)
+        return mask
     
-    print(f"\nWritten to: {output_path}")
+    return match
 
 
-def smart_match(series, target_value):
-    """Compare values - numeric if possible, otherwise case-sensitive string"""
-    try:
-        target_numeric = pd.to_numeric(target_value)
-        series_numeric = pd.to_numeric(series, errors='coerce')
-        valid_numeric = series_numeric.notna()
-        numeric_mask = series_numeric == target_numeric
-        string_mask = series.astype(str) == str(target_value)
-        result = numeric_mask.copy()
-        result[~valid_numeric] = string_mask[~valid_numeric]
-        return result
-    except (ValueError, TypeError):
-        return series.astype(str) == str(target_value)
+def numeric_rule_positions(numbers, target_values):
+    """Position of the last target equal to each number, -1 where none matches
+    
+    Returns None unless all numbers and targets are numbers, which is when
+    matching reduces to a plain numeric comparison
+    """
+    targets = to_numbers(target_values)
+    if np.isnan(numbers).any() or np.isnan(targets).any():
+        return None
+    
+    # Later rules win, so keep the last occurrence of each target
+    last = ~pd.Index(targets).duplicated(keep='last')
+    positions = pd.Index(targets[last]).get_indexer(numbers)
+    
+    # Only look up matched values, there may be no targets at all
+    rule_pos = np.full(len(numbers), -1)
+    matched = positions >= 0
+    rule_pos[matched] = np.flatnonzero(last)[positions[matched]]
+    return rule_pos
 
 
 def apply_updates(rpt_data, update_values_df, columns_with_quotes):
@@ -190,10 +324,11 @@ def apply_updates(rpt_data, update_values_df, columns_with_quotes):
     # Add columns
     add_actions = update_values_df[update_values_df['Action'] == 'add']
     if not add_actions.empty:
-        for idx, row in add_actions.iterrows():
-            column_name = row['ColumnName']
-            new_value = row['NewValue']
-            rpt_data[column_name] = new_value
+        new_columns = {}
+        for row in add_actions.itertuples(index=False):
+            column_name = row.ColumnName
+            new_value = row.NewValue
+            new_columns[column_name] = new_value
             
             # Mark string columns for quoting
             try:
@@ -201,105 +336,196 @@ def apply_updates(rpt_data, update_values_df, columns_with_quotes):
             except (ValueError, TypeError):
                 columns_with_quotes.add(column_name)
             
-            print(f"Added column '{column_name}' with value: {new_value}")
+            logger.info("Added column '%s' with value: %s", column_name, new_value)
+        
+        # Insert the columns in place, assign() would copy every existing column
+        for column_name, new_value in new_columns.items():
+            rpt_data[column_name] = new_value
     
     # Delete columns
     delete_actions = update_values_df[update_values_df['Action'] == 'delete']
     if not delete_actions.empty:
-        for idx, row in delete_actions.iterrows():
-            column_name = row['ColumnName']
-            if column_name in rpt_data.columns:
-                rpt_data = rpt_data.drop(columns=[column_name])
-                print(f"Deleted column '{column_name}'")
+        drop_columns = [c for c in dict.fromkeys(delete_actions['ColumnName']) if c in rpt_data.columns]
+        
+        # Drop all columns in one step, in place
+        rpt_data.drop(columns=drop_columns, inplace=True)
+        for column_name in drop_columns:
+            logger.info("Deleted column '%s'", column_name)
     
-    # Update columns - optimized with merge/join
+    # Update columns
     update_actions = update_values_df[update_values_df['Action'] == 'update']
     if not update_actions.empty:
+        # Numeric values and matchers of lookup columns, reused across rules
+        # until the column changes
+        matchers = {}
+        
         # Group by ColumnName and LookupColumn
         grouped = update_actions.groupby(['ColumnName', 'LookupColumn'])
         
         for (column_name, lookup_column), group in grouped:
             if column_name not in rpt_data.columns:
-                print(f"Column '{column_name}' not found, skipping {len(group)} update(s)")
+                logger.warning("Column '%s' not found, skipping %d update(s)", column_name, len(group))
                 continue
             
-            # If lookup column is specified, use merge-based update
+            # If lookup column is specified, update rows matching each LookupValue
             if pd.notna(lookup_column) and lookup_column in rpt_data.columns:
-                # Create mapping DataFrame
-                mapping_df = group[['LookupValue', 'NewValue']].drop_duplicates()
-                mapping_df = mapping_df.rename(columns={'LookupValue': lookup_column, 'NewValue': f'_new_{column_name}'})
+                if lookup_column not in matchers:
+                    lookup_numbers = to_numbers(rpt_data[lookup_column])
+                    matchers[lookup_column] = lookup_numbers, make_matcher(rpt_data[lookup_column], lookup_numbers)
+                lookup_numbers, match = matchers[lookup_column]
                 
-                # Merge with main data
-                rpt_data = rpt_data.merge(mapping_df, on=lookup_column, how='left')
+                # Rules with an empty NewValue leave matching rows unchanged
+                rules = group[group['NewValue'].notna()]
                 
-                # Update column where match found
-                mask = rpt_data[f'_new_{column_name}'].notna()
-                rpt_data.loc[mask, column_name] = rpt_data.loc[mask, f'_new_{column_name}']
+                # Apply every rule to one copy of the column and store it once, so all
+                # rules match against the original values
+                column = rpt_data[column_name]
+                string_column = isinstance(column.dtype, pd.StringDtype)
+                values = column.to_numpy(dtype=object, copy=True)
+                rule_pos = numeric_rule_positions(lookup_numbers, rules['LookupValue'])
+                if rule_pos is not None:
+                    # Numbers on both sides - match every rule in one pass
+                    updated = rule_pos >= 0
+                    new_values = rules['NewValue'].to_numpy(dtype=object)
+                    if string_column:
+                        new_values = np.array([str(v) for v in new_values], dtype=object)
+                    values[updated] = new_values[rule_pos[updated]]
+                else:
+                    updated = np.zeros(len(values), dtype=bool)
+                    for row in rules.itertuples(index=False):
+                        mask = match(row.LookupValue)
+                        # String columns only accept string values
+                        values[mask] = str(row.NewValue) if string_column else row.NewValue
+                        updated |= mask
                 
-                # Drop temporary column
-                rpt_data = rpt_data.drop(columns=[f'_new_{column_name}'])
+                if string_column:
+                    rpt_data[column_name] = pd.array(values, dtype=column.dtype)
+                else:
+                    rpt_data[column_name] = pd.Series(values, index=rpt_data.index).infer_objects()
+                matchers.pop(column_name, None)
                 
-                print(f"Updated '{column_name}' using '{lookup_column}' join ({len(mapping_df)} mappings, {mask.sum()} rows updated)")
+                logger.info("Updated '%s' using '%s' lookup (%d mappings)", column_name, lookup_column, len(rules))
+                # Counting the rows is another pass over the mask, only do it when debugging
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%d rows updated in '%s'", updated.sum(), column_name)
             
-            # No lookup column - direct updates
+            # No lookup column - direct updates, only the last one is kept
             else:
-                for idx, row in group.iterrows():
-                    rpt_data[column_name] = row['NewValue']
-                    print(f"Updated all rows in '{column_name}' to '{row['NewValue']}'")
+                new_value = group['NewValue'].iloc[-1]
+                rpt_data[column_name] = new_value
+                matchers.pop(column_name, None)
+                
+                logger.info("Updated all rows in '%s' to '%s' (%d update(s))", column_name, new_value, len(group))
     
     return rpt_data
 
 
-# ============================================
-# MAIN SCRIPT
-# ============================================
-
-input_folder = Path(INPUT_FOLDER_PATH)
-output_folder = Path(OUTPUT_FOLDER_PATH)
-
-# Create output folder if it doesn't exist
-output_folder.mkdir(parents=True, exist_ok=True)
-
-rpt_files = []
-for pattern in RPT_FILE_PATTERNS:
-    rpt_files.extend(input_folder.glob(pattern))
-
-print(f"\nFound {len(rpt_files)} RPT file(s) to process")
-
-# Load Excel file with update instructions
-has_excel = os.path.exists(EXCEL_FILE_PATH)
+def read_update_values(excel_path, sheet_name):
+    """Read update instructions, reusing a cached copy while the Excel file is unchanged"""
+    cache_path = f"{excel_path}.{sheet_name}.parquet"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning("Could not read cached update values, reading Excel file instead: %s", e)
+    
+    update_values_df = pd.read_excel(excel_path, sheet_name=sheet_name)
+    
+    # Parquet needs one type per column, so mixed columns are stored as text
+    for column_name in update_values_df.columns:
+        if update_values_df[column_name].dtype == object:
+            update_values_df[column_name] = update_values_df[column_name].map(str, na_action='ignore')
+    
+    # Write to a temporary file first, so other runs never read a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        update_values_df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not cache update values: %s", e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return update_values_df
 
-if has_excel:
-    update_values_df = pd.read_excel(EXCEL_FILE_PATH, sheet_name=EXCEL_SHEET_NAME)
-    print("\n" + "="*60)
-    print("UPDATE VALUES DATA")
-    print("="*60)
-    print(update_values_df)
-else:
-    update_values_df = None
 
-# Process each RPT file
-for source_file in rpt_files:
-    print("\n" + "="*60)
-    print(f"PROCESSING: {source_file.name}")
-    print("="*60)
+def process_one(source_file, update_values_df, output_folder):
+    """Read, update, and write a single RPT file"""
+    logger.info("=" * 60)
+    logger.info("PROCESSING: %s", source_file.name)
+    logger.info("=" * 60)
     
     rpt_data, header_line, footer_lines, columns_with_quotes, column_marker = read_rpt_file(source_file)
-
-    print("\nOriginal Data:")
-    print(rpt_data)
-    print(f"Shape: {rpt_data.shape}")
+    logger.info("Shape: %s", rpt_data.shape)
     
-    if has_excel and update_values_df is not None:
+    # Formatting a whole DataFrame is expensive, only do it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Original Data:\n%s", rpt_data)
+    
+    if update_values_df is not None:
         rpt_data = apply_updates(rpt_data, update_values_df, columns_with_quotes)
+        logger.info("Updated shape: %s", rpt_data.shape)
         
-        print("\nUpdated Data:")
-        print(rpt_data)
-        print(f"Shape: {rpt_data.shape}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated Data:\n%s", rpt_data)
     
     output_file = output_folder / f"{source_file.stem}{OUTPUT_SUFFIX}{source_file.suffix}"
     write_rpt_file(rpt_data, output_file, header_line, footer_lines, columns_with_quotes, column_marker)
 
-print("\n" + "="*60)
-print("ALL FILES PROCESSED")
-print("="*60)
+
+# Update rules of the current worker process, set once by init_worker
+worker_update_values_df = None
+
+
+def init_worker(update_values_df):
+    """Set up logging and keep the update rules in the worker, so they are sent once per process"""
+    global worker_update_values_df
+    init_logging()
+    worker_update_values_df = update_values_df
+
+
+def process_in_worker(source_file, output_folder):
+    """Process a single RPT file with the rules given to init_worker"""
+    process_one(source_file, worker_update_values_df, output_folder)
+
+
+# ============================================
+# MAIN SCRIPT
+# ============================================
+
+if __name__ == '__main__':
+    init_logging()
+    
+    input_folder = Path(INPUT_FOLDER_PATH)
+    output_folder = Path(OUTPUT_FOLDER_PATH)
+    
+    # Create output folder if it doesn't exist
+    output_folder.mkdir(parents=True, exist_ok=True)
+    
+    rpt_files = []
+    for pattern in RPT_FILE_PATTERNS:
+        rpt_files.extend(input_folder.glob(pattern))
+    
+    logger.info("Found %d RPT file(s) to process", len(rpt_files))
+    
+    # Load Excel file with update instructions
+    has_excel = os.path.exists(EXCEL_FILE_PATH)
+    
+    if has_excel:
+        update_values_df = read_update_values(EXCEL_FILE_PATH, EXCEL_SHEET_NAME)
+        logger.info("Loaded %d update instruction(s) from %s", len(update_values_df), EXCEL_FILE_PATH)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Update Values Data:\n%s", update_values_df)
+    else:
+        update_values_df = None
+    
+    # Process RPT files in parallel, they are independent of each other
+    with ProcessPoolExecutor(
+        max_workers=MAX_WORKERS,
+        initializer=init_worker,
+        initargs=(update_values_df,),
+    ) as executor:
+        list(executor.map(partial(process_in_worker, output_folder=output_folder), rpt_files))
+    
+    logger.info("=" * 60)
+    logger.info("ALL FILES PROCESSED")
+    logger.info("=" * 60)